@@ -31,6 +31,9 @@ CREATE TABLE documents (
 CREATE INDEX ON documents USING ivfflat (embedding vector_cosine_ops)
 WITH (lists = 100);
 
+-- Unique titles so scripts can upsert resources on title in one request
+CREATE UNIQUE INDEX IF NOT EXISTS resources_title_key ON resources (title);
+
 -- Full-text search index on resources
 CREATE INDEX resources_search_idx ON resources USING GIN (
   to_tsvector('english', title || ' ' || COALESCE(description, ''))
@@ -61,6 +64,59 @@ AS $$
   LIMIT match_count;
 $$;
 
+-- Bulk upsert for the data collection scripts: one call writes a whole
+-- JSON array of resources, matched on title. Returns one row with the
+-- number of rows written (PostgREST clients expect a row set).
+-- Like upsert_resource's per-row upsert, a key sent as null clears the
+-- column, while keys a payload row leaves out keep their stored value;
+-- the country/last_updated defaults only apply to new rows. If a title
+-- appears more than once, the last occurrence wins.
+CREATE OR REPLACE FUNCTION upsert_resources(payload JSONB)
+RETURNS TABLE (affected INTEGER)
+LANGUAGE SQL
+AS $$
+  WITH incoming AS (
+    SELECT DISTINCT ON (x.title) x.*, e.value AS payload
+    FROM jsonb_array_elements(payload) WITH ORDINALITY AS e(value, position),
+      jsonb_populate_record(NULL::resources, e.value) AS x
+    ORDER BY x.title, e.position DESC
+  ),
+  updated AS (
+    UPDATE resources r SET
+      description = CASE WHEN i.payload ? 'description' THEN i.description ELSE r.description END,
+      url = CASE WHEN i.payload ? 'url' THEN i.url ELSE r.url END,
+      category = CASE WHEN i.payload ? 'category' THEN i.category ELSE r.category END,
+      country = CASE WHEN i.payload ? 'country' THEN i.country ELSE r.country END,
+      institution = CASE WHEN i.payload ? 'institution' THEN i.institution ELSE r.institution END,
+      deadline = CASE WHEN i.payload ? 'deadline' THEN i.deadline ELSE r.deadline END,
+      eligibility = CASE WHEN i.payload ? 'eligibility' THEN i.eligibility ELSE r.eligibility END,
+      amount = CASE WHEN i.payload ? 'amount' THEN i.amount ELSE r.amount END,
+      tags = CASE WHEN i.payload ? 'tags' THEN i.tags ELSE r.tags END,
+      metadata = CASE WHEN i.payload ? 'metadata' THEN i.metadata ELSE r.metadata END,
+      last_updated = CASE WHEN i.payload ? 'last_updated' THEN i.last_updated ELSE r.last_updated END
+    FROM incoming i
+    WHERE r.title = i.title
+    RETURNING r.title
+  ),
+  inserted AS (
+    INSERT INTO resources (
+      title, description, url, category, country, institution,
+      deadline, eligibility, amount, tags, metadata, last_updated
+    )
+    SELECT
+      i.title, i.description, i.url, i.category,
+      CASE WHEN i.payload ? 'country' THEN i.country ELSE 'Canada' END,
+      i.institution, i.deadline, i.eligibility, i.amount, i.tags, i.metadata,
+      CASE WHEN i.payload ? 'last_updated' THEN i.last_updated ELSE NOW() END
+    FROM incoming i
+    WHERE NOT EXISTS (SELECT 1 FROM updated u WHERE u.title = i.title)
+    -- A row inserted concurrently since this statement started
+    ON CONFLICT (title) DO NOTHING
+    RETURNING 1
+  )
+  SELECT ((SELECT COUNT(*) FROM updated) + (SELECT COUNT(*) FROM inserted))::INTEGER;
+$$;
+
 -- Sample data
 INSERT INTO resources (title, description, url, category, institution, deadline, tags) VALUES
 ('Lester B. Pearson International Scholarship', 'Full-ride scholarship for international students at University of Toronto covering tuition, books, incidental fees, and residence support.', 'https://future.utoronto.ca/pearson/', 'scholarship', 'University of Toronto', '2026-01-15', ARRAY['full-tuition', 'undergraduate', 'high-achiever']),
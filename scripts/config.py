@@ -15,6 +15,9 @@ load_dotenv()
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
 
+# Rows per request in bulk upserts (keeps payloads under PostgREST limits)
+UPSERT_BATCH_SIZE = 1000
+
 # ============================================
 # SCRAPING SETTINGS
 # ============================================
@@ -30,6 +33,21 @@ REQUEST_TIMEOUT = 30
 # Maximum retries per request
 MAX_RETRIES = 3
 
+# Server errors worth retrying (other statuses fail immediately)
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Largest response body a scraper will download (bytes)
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# How long a parsed robots.txt is reused before re-fetching (seconds)
+ROBOTS_TXT_TTL = 6 * 3600
+
+# Parsed robots.txt files kept between scraper runs
+ROBOTS_CACHE_PATH = 'data/.robots.pickle'
+
+# ETags / Last-Modified dates and results of previous scraper runs
+HTTP_CACHE_PATH = 'data/.http_cache.json'
+
 # ============================================
 # DATA SOURCES
 # ============================================
@@ -37,6 +55,7 @@ MAX_RETRIES = 3
 # Scholarship sources (websites that allow scraping or have APIs)
 SCHOLARSHIP_SOURCES: List[Dict[str, str]] = [
     {
+        'key': 'educanada',
         'name': 'EduCanada Scholarships',
         'url': 'https://www.educanada.ca/scholarships-bourses/index.aspx',
         'type': 'official',
@@ -44,6 +63,7 @@ SCHOLARSHIP_SOURCES: List[Dict[str, str]] = [
         'note': 'Canadian government official scholarship database'
     },
     {
+        'key': 'utoronto',
         'name': 'University of Toronto Scholarships',
         'url': 'https://future.utoronto.ca/finances/awards/',
         'type': 'university',
@@ -51,6 +71,7 @@ SCHOLARSHIP_SOURCES: List[Dict[str, str]] = [
         'note': 'UofT financial aid page'
     },
     {
+        'key': 'ubc',
         'name': 'UBC Awards Database',
         'url': 'https://you.ubc.ca/financial-planning/scholarships-awards-international-students/',
         'type': 'university',
@@ -92,7 +113,32 @@ JOB_SOURCES: List[Dict[str, str]] = [
 STALE_DATA_THRESHOLD_DAYS = 90
 
 # HTTP status codes considered "broken"
-BROKEN_STATUS_CODES = [404, 403, 410, 500, 502, 503]
+BROKEN_STATUS_CODES = frozenset({404, 403, 410, 500, 502, 503})
+
+# Resources fetched and validated per page; link checks for a page start
+# as soon as it has been validated
+VALIDATION_BATCH_SIZE = 500
+
+# Maximum URL checks in flight at once
+URL_CHECK_CONCURRENCY = 200
+
+# Maximum simultaneous connections to any one server while checking URLs
+URL_CHECK_PER_HOST = 4
+
+# HEAD responses meaning "try GET instead" rather than a broken link
+HEAD_UNSUPPORTED_STATUS_CODES = frozenset({405, 501})
+
+# URL check results are reused for this long before re-checking (seconds),
+# unless the server's Cache-Control/Expires headers say otherwise
+URL_CACHE_TTL = 24 * 3600
+# Upper bound on header-driven lifetimes
+URL_CACHE_MAX_TTL = 7 * 24 * 3600
+URL_CACHE_PATH = 'logs/.url_cache.json'
+
+# Resources that passed every check within this long (seconds) and haven't
+# changed since are not re-checked
+UNCHANGED_RESOURCE_TTL = 24 * 3600
+PREV_RESULTS_PATH = 'logs/.prev_hashes.json'
 
 # ============================================
 # LOGGING
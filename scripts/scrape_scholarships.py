@@ -11,24 +11,20 @@
     """
 
 import argparse
-import json
+import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import orjson
+
 from utils.scraper_base import EthicalScraper
 from utils.supabase_client import SupabaseManager
 from config import SCHOLARSHIP_SOURCES
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scrape_scholarships.log'),
-        logging.StreamHandler()
-    ]
-)
+DATA_DIR = Path('data')
 
 class ScholarshipScraper(EthicalScraper):
     """
@@ -42,8 +38,14 @@ class ScholarshipScraper(EthicalScraper):
         super().__init__('ScholarshipScraper')
         self.db = SupabaseManager()
         self.scraped_scholarships: List[Dict[str, Any]] = []
+        # Source key (see SCHOLARSHIP_SOURCES) -> scraper method
+        self._handlers = {
+            'educanada': self.scrape_educanada,
+            'utoronto': self.scrape_university_page,
+            'ubc': self.scrape_university_page
+        }
     
-    def scrape_educanada(self) -> List[Dict[str, Any]]:
+    async def scrape_educanada(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
         """
         Scrape scholarships from EduCanada.
         
@@ -52,22 +54,31 @@ class ScholarshipScraper(EthicalScraper):
         or manually curate from their database.
         
         This is a demonstration of the scraping pattern.
+        
+        Args:
+            source: Source dictionary with URL and metadata
+            
+        Returns:
+            List of scholarship dictionaries
         """
-        source = next(s for s in SCHOLARSHIP_SOURCES if 'educanada' in s['url'].lower())
         url = source['url']
         
         # Check robots.txt
-        if not self.check_robots_txt(url, source['robots_txt']):
+        if not await self.check_robots_txt(url, source['robots_txt']):
             self.logger.warning(f"Skipping {url} - disallowed by robots.txt")
             return []
         
         # Fetch page
-        response = self.fetch_page(url)
-        if not response:
+        page = await self.fetch_page(url)
+        if not page:
             return []
         
-        soup = self.parse_html(response.text)
-        if not soup:
+        response, body = page
+        if response.status == 304:
+            return self.cached_result(url)
+        
+        tree = self.parse_html(body, response.charset)
+        if tree is None:
             return []
         
         scholarships = []
@@ -75,29 +86,41 @@ class ScholarshipScraper(EthicalScraper):
         # Example parsing logic (you'll need to adjust based on actual page structure)
         # This is pseudocode - actual selectors depend on the website
         
-        # scholarship_cards = soup.select('.scholarship-card')  # Example selector
+        # scholarship_cards = tree.css('.scholarship-card')  # Example selector
         # 
-        # for card in scholarship_cards:
-        #     scholarship = {
-        #         'title': self.clean_text(self.extract_text(card, '.title')),
-        #         'description': self.clean_text(self.extract_text(card, '.description')),
-        #         'url': card.find('a')['href'] if card.find('a') else None,
-        #         'institution': self.clean_text(self.extract_text(card, '.institution')),
+        # # Extract one column per field, then build each row dict exactly once
+        # titles = [self.clean_text(self.extract_text(c, '.title')) for c in scholarship_cards]
+        # descriptions = [self.clean_text(self.extract_text(c, '.description')) for c in scholarship_cards]
+        # urls = [c.css_first('a').attributes.get('href') if c.css_first('a') else None
+        #         for c in scholarship_cards]
+        # institutions = [self.clean_text(self.extract_text(c, '.institution')) for c in scholarship_cards]
+        # scraped_at = datetime.now().isoformat()
+        # 
+        # scholarships = [
+        #     {
+        #         'title': title,
+        #         'description': description,
+        #         'url': url,
+        #         'institution': institution,
         #         'category': 'scholarship',
         #         'country': 'Canada',
         #         'tags': ['international-students', 'official'],
         #         'metadata': {
         #             'source': 'EduCanada',
-        #             'scraped_at': datetime.now().isoformat(),
-        #             'last_verified': datetime.now().isoformat()
+        #             'scraped_at': scraped_at,
+        #             'last_verified': scraped_at
         #         }
         #     }
-        #     scholarships.append(scholarship)
+        #     for title, description, url, institution
+        #     in zip(titles, descriptions, urls, institutions)
+        # ]
+        
+        self.cache_result(url, response, scholarships)
         
         self.logger.info(f"Scraped {len(scholarships)} scholarships from EduCanada")
         return scholarships
     
-    def scrape_university_page(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
+    async def scrape_university_page(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
         """
         Generic scraper for university scholarship pages.
         
@@ -110,16 +133,20 @@ class ScholarshipScraper(EthicalScraper):
         url = source['url']
         
         # Check robots.txt
-        if not self.check_robots_txt(url, source['robots_txt']):
+        if not await self.check_robots_txt(url, source['robots_txt']):
             self.logger.warning(f"Skipping {url} - disallowed by robots.txt")
             return []
         
-        response = self.fetch_page(url)
-        if not response:
+        page = await self.fetch_page(url)
+        if not page:
             return []
         
-        soup = self.parse_html(response.text)
-        if not soup:
+        response, body = page
+        if response.status == 304:
+            return self.cached_result(url)
+        
+        tree = self.parse_html(body, response.charset)
+        if tree is None:
             return []
         
         scholarships = []
@@ -127,6 +154,8 @@ class ScholarshipScraper(EthicalScraper):
         # University pages typically list scholarships with links to detail pages
         # This is a template - customize for each university's structure
         
+        self.cache_result(url, response, scholarships)
+        
         self.logger.info(f"Scraped {len(scholarships)} scholarships from {source['name']}")
         return scholarships
     
@@ -156,29 +185,43 @@ class ScholarshipScraper(EthicalScraper):
             }
         }
     
-    def scrape_all_sources(self) -> List[Dict[str, Any]]:
+    async def _dispatch(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
         """
-        Scrape all configured scholarship sources.
+        Scrape a single source, logging (not raising) any failure.
         
+        Args:
+            source: Source dictionary with URL and metadata
+            
         Returns:
-            Combined list of scholarships from all sources
+            List of scholarship dictionaries (empty on error)
         """
-        all_scholarships = []
+        self.logger.info(f"Processing source: {source['name']}")
         
-        for source in SCHOLARSHIP_SOURCES:
-            self.logger.info(f"Processing source: {source['name']}")
+        try:
+            handler = self._handlers.get(source['key'], self.scrape_university_page)
+            return await handler(source)
             
-            try:
-                if 'educanada' in source['url'].lower():
-                    scholarships = self.scrape_educanada()
-                else:
-                    scholarships = self.scrape_university_page(source)
-                
-                all_scholarships.extend(scholarships)
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping {source['name']}: {e}")
-                continue
+        except Exception as e:
+            self.logger.error(f"Error scraping {source['name']}: {e}")
+            return []
+    
+    async def scrape_all_sources(self) -> List[Dict[str, Any]]:
+        """
+        Scrape all configured scholarship sources concurrently.
+        
+        Sources on different hosts are fetched in parallel; requests to the
+        same host are still rate limited.
+        
+        Returns:
+            Combined list of scholarships from all sources
+        """
+        results = await asyncio.gather(
+            *[self._dispatch(source) for source in SCHOLARSHIP_SOURCES]
+        )
+        
+        all_scholarships = []
+        for scholarships in results:
+            all_scholarships.extend(scholarships)
         
         return all_scholarships
     
@@ -186,15 +229,19 @@ class ScholarshipScraper(EthicalScraper):
         """
         Save scraped scholarships to JSON file for review before database insertion.
         
+        The file is written to a temporary name and renamed into place, so an
+        interrupted run never leaves a truncated file behind.
+        
         Args:
             scholarships: List of scholarship dictionaries
-            filename: Output filename
+            filename: Output filename (inside DATA_DIR)
         """
-        output_path = Path('data') / filename
-        output_path.parent.mkdir(exist_ok=True)
+        DATA_DIR.mkdir(exist_ok=True)
+        output_path = DATA_DIR / filename
+        tmp_path = DATA_DIR / f'.{filename}.tmp'
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(scholarships, f, indent=2, ensure_ascii=False)
+        tmp_path.write_bytes(orjson.dumps(scholarships, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, output_path)
         
         self.logger.info(f"Saved {len(scholarships)} scholarships to {output_path}")
     
@@ -219,7 +266,7 @@ class ScholarshipScraper(EthicalScraper):
             f"{results['failed']} failed"
         )
 
-def main():
+async def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description='Scrape scholarship data')
     parser.add_argument(
@@ -243,9 +290,18 @@ def main():
     
     # Create logs directory
     Path('logs').mkdir(exist_ok=True)
-    Path('data').mkdir(exist_ok=True)
     
-    scraper = ScholarshipScraper()
+    # Configure logging here, not at import, and don't open a second log
+    # file if the caller already set up handlers
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('logs/scrape_scholarships.log'),
+                logging.StreamHandler()
+            ]
+        )
     
     print("="*60)
     print("Nepali Abroad Helper - Scholarship Scraper")
@@ -254,21 +310,22 @@ def main():
     print(f"Dry run: {args.dry_run}")
     print("="*60)
     
-    # Scrape scholarships
-    scholarships = scraper.scrape_all_sources()
-    
-    # Save to file
-    scraper.save_to_file(scholarships, args.output)
-    
-    # Update database
-    if scholarships:
-        scraper.update_database(scholarships, dry_run=args.dry_run)
-    else:
-        print("\n⚠️  No scholarships scraped. Check logs for details.")
-        print("\nNote: Many scholarship websites don't allow scraping.")
-        print("Consider manual curation or using official APIs instead.")
+    async with ScholarshipScraper() as scraper:
+        # Scrape scholarships
+        scholarships = await scraper.scrape_all_sources()
+        
+        # Save to file
+        scraper.save_to_file(scholarships, args.output)
+        
+        # Update database
+        if scholarships:
+            scraper.update_database(scholarships, dry_run=args.dry_run)
+        else:
+            print("\n⚠️  No scholarships scraped. Check logs for details.")
+            print("\nNote: Many scholarship websites don't allow scraping.")
+            print("Consider manual curation or using official APIs instead.")
     
     print("\n✅ Scraping complete! Check logs/scrape_scholarships.log for details.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+On-disk cache of parsed robots.txt files, shared between scraper runs.
+"""
+
+import time
+import pickle
+import logging
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.robotparser import RobotFileParser
+from config import ROBOTS_CACHE_PATH, ROBOTS_TXT_TTL
+
+logger = logging.getLogger(__name__)
+
+def load_robots_cache() -> Dict[str, Tuple[RobotFileParser, float]]:
+    """
+    Load parsers saved by a previous run, dropping any older than ROBOTS_TXT_TTL.
+    
+    Returns:
+        Dictionary of robots_url -> (parser, fetched_at)
+    """
+    try:
+        cache = pickle.loads(Path(ROBOTS_CACHE_PATH).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable robots.txt cache {ROBOTS_CACHE_PATH}: {e}")
+        return {}
+    
+    now = time.time()
+    return {
+        robots_url: entry
+        for robots_url, entry in cache.items()
+        if now - entry[1] < ROBOTS_TXT_TTL
+    }
+
+def save_robots_cache(cache: Dict[str, Tuple[RobotFileParser, float]]) -> None:
+    """
+    Persist parsed robots.txt files for the next run.
+    
+    Args:
+        cache: Dictionary of robots_url -> (parser, fetched_at)
+    """
+    try:
+        cache_path = Path(ROBOTS_CACHE_PATH)
+        cache_path.parent.mkdir(exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(cache))
+    except OSError as e:
+        logger.error(f"Error saving robots.txt cache: {e}")
@@ -3,23 +3,34 @@ Base scraper class with ethical scraping practices built-in.
 All specific scrapers should inherit from this class.
 """
 
+import re
 import time
+import asyncio
 import logging
-import requests
-from typing import Optional, Dict, Any
+import unicodedata
+import aiohttp
+import orjson
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Union
+from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser, Node
+from utils.robots_cache import load_robots_cache, save_robots_cache
 from config import (
     REQUEST_DELAY,
     USER_AGENT,
     REQUEST_TIMEOUT,
-    MAX_RETRIES
+    MAX_RETRIES,
+    RETRY_STATUS_CODES,
+    MAX_RESPONSE_BYTES,
+    ROBOTS_TXT_TTL,
+    HTTP_CACHE_PATH
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_WHITESPACE_RE = re.compile(r'\s+')
 
 class EthicalScraper:
     """
@@ -27,22 +38,154 @@ class EthicalScraper:
     
     Features:
     - Automatic robots.txt compliance
-    - Rate limiting
+    - Per-host rate limiting
     - Proper error handling
     - Request retries with exponential backoff
+    - Concurrent fetching across hosts (aiohttp)
+    - Conditional GETs (ETag / Last-Modified) for unchanged pages
+    
+    Must be used as an async context manager so the HTTP session is
+    opened and closed inside the running event loop:
+    
+        async with MyScraper() as scraper:
+            await scraper.fetch_page(url)
     """
     
+    # Parsed robots.txt files shared by all scrapers: robots_url -> (parser, fetched_at)
+    # (persisted between runs by utils.robots_cache)
+    _robots_cache: Dict[str, Tuple[RobotFileParser, float]] = {}
+    
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(name)
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': USER_AGENT})
-        self.last_request_time = 0
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.last_request_time: Dict[str, float] = defaultdict(float)
+        self._http_cache: Dict[str, Dict[str, Any]] = self._load_http_cache()
         
-    def check_robots_txt(self, url: str, robots_url: str) -> bool:
+        # Reuse robots.txt files parsed by earlier runs that are still fresh
+        for robots_url, entry in load_robots_cache().items():
+            self._robots_cache.setdefault(robots_url, entry)
+    
+    async def __aenter__(self) -> 'EthicalScraper':
+        self.session = aiohttp.ClientSession(
+            headers={'User-Agent': USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=10, limit_per_host=1)
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+        self.session = None
+        self._save_http_cache()
+        save_robots_cache(self._robots_cache)
+    
+    def _load_http_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load validators and results of previous runs from HTTP_CACHE_PATH.
+        
+        Returns:
+            Dictionary of url -> cache entry (empty if missing or unreadable)
+        """
+        try:
+            with open(HTTP_CACHE_PATH, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable HTTP cache {HTTP_CACHE_PATH}: {e}")
+            return {}
+    
+    def _save_http_cache(self) -> None:
+        """
+        Persist the HTTP cache so the next run can send conditional requests.
+        """
+        try:
+            cache_path = Path(HTTP_CACHE_PATH)
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps(self._http_cache))
+        except OSError as e:
+            self.logger.error(f"Error saving HTTP cache: {e}")
+    
+    def cache_result(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        result: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Remember what a page produced, keyed by its ETag / Last-Modified.
+        
+        The next fetch_page of the same URL becomes a conditional GET; if the
+        server answers 304, use cached_result(url) instead of re-parsing.
+        
+        Args:
+            url: Page URL
+            response: Response the result was parsed from
+            result: Data extracted from the page
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        
+        if not etag and not last_modified:
+            # Server doesn't support conditional requests
+            self._http_cache.pop(url, None)
+            return
+        
+        self._http_cache[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'result': result
+        }
+    
+    def cached_result(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Get the data stored by cache_result for an unchanged (304) page.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Previously extracted data (empty list if none)
+        """
+        return self._http_cache.get(url, {}).get('result', [])
+        
+    async def _fetch_robots_txt(self, robots_url: str) -> RobotFileParser:
+        """
+        Download and parse a robots.txt file over the shared session.
+        
+        Mirrors RobotFileParser.read(): 401/403 disallow everything, other
+        4xx allow everything, anything else must parse successfully.
+        
+        Args:
+            robots_url: URL of robots.txt file
+            
+        Returns:
+            Parsed RobotFileParser
+        """
+        parser = RobotFileParser()
+        parser.set_url(robots_url)
+        
+        async with self.session.get(robots_url) as response:
+            if response.status in (401, 403):
+                parser.disallow_all = True
+            elif 400 <= response.status < 500:
+                parser.allow_all = True
+            else:
+                response.raise_for_status()
+                text = await response.text(errors='replace')
+                parser.parse(text.splitlines())
+        
+        return parser
+    
+    async def check_robots_txt(self, url: str, robots_url: str) -> bool:
         """
         Check if URL is allowed by robots.txt.
         
+        Parsed robots.txt files are cached per robots_url for
+        ROBOTS_TXT_TTL seconds, so each domain is fetched once per run.
+        
         Args:
             url: URL to check
             robots_url: URL of robots.txt file
@@ -51,9 +194,14 @@ class EthicalScraper:
             True if allowed, False otherwise
         """
         try:
-            parser = RobotFileParser()
-            parser.set_url(robots_url)
-            parser.read()
+            now = time.time()
+            cached = self._robots_cache.get(robots_url)
+            
+            if cached and now - cached[1] < ROBOTS_TXT_TTL:
+                parser = cached[0]
+            else:
+                parser = await self._fetch_robots_txt(robots_url)
+                self._robots_cache[robots_url] = (parser, now)
             
             is_allowed = parser.can_fetch(USER_AGENT, url)
             
@@ -67,107 +215,210 @@ class EthicalScraper:
             # If we can't read robots.txt, be conservative and skip
             return False
     
-    def rate_limit(self) -> None:
+    async def rate_limit(self, url: str) -> None:
         """
-        Enforce rate limiting between requests.
+        Enforce rate limiting between requests to the same host.
+        
+        Requests to different hosts don't wait on each other. Each caller
+        reserves the next free slot for its host before sleeping, so
+        concurrent requests to one host are spaced REQUEST_DELAY apart
+        without holding a lock while they wait.
+        
+        Args:
+            url: URL about to be requested
         """
-        elapsed = time.time() - self.last_request_time
-        if elapsed < REQUEST_DELAY:
-            sleep_time = REQUEST_DELAY - elapsed
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        host = urlparse(url).netloc
+        
+        # No await between reading and updating the slot, so this is atomic
+        # within the event loop
+        now = time.time()
+        slot = max(now, self.last_request_time[host] + REQUEST_DELAY)
+        self.last_request_time[host] = slot
         
-        self.last_request_time = time.time()
+        if slot > now:
+            sleep_time = slot - now
+            self.logger.debug(f"Rate limiting {host}: sleeping for {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
     
-    def fetch_page(
+    def _retry_after(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """
+        Read the server's Retry-After header, if any.
+        
+        Args:
+            response: Response that is about to be retried
+            
+        Returns:
+            Seconds to wait, or None if the header is missing or malformed
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        
+        if value.isdigit():
+            return float(value)
+        
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+    
+    async def _read_body(self, url: str, response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """
+        Stream a response body, giving up once it exceeds MAX_RESPONSE_BYTES.
+        
+        Args:
+            url: URL being fetched (for logging)
+            response: Response whose body to read
+            
+        Returns:
+            Body bytes or None if the body is too large
+        """
+        if response.content_length and response.content_length > MAX_RESPONSE_BYTES:
+            self.logger.warning(
+                f"Oversize body for {url} ({response.content_length} bytes), skipping"
+            )
+            return None
+        
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body += chunk
+            if len(body) > MAX_RESPONSE_BYTES:
+                self.logger.warning(f"Oversize body for {url}, aborting")
+                return None
+        
+        return bytes(body)
+    
+    async def fetch_page(
         self,
         url: str,
         method: str = 'GET',
-        data: Optional[Dict] = None,
-        retry_count: int = 0
-    ) -> Optional[requests.Response]:
+        data: Optional[Dict] = None
+    ) -> Optional[Tuple[aiohttp.ClientResponse, bytes]]:
         """
         Fetch a page with error handling and retries.
         
+        Responses with a status in RETRY_STATUS_CODES are retried up to
+        MAX_RETRIES times with exponential backoff (or the server's
+        Retry-After, when sent). Other errors are not retried.
+        
+        GETs for URLs stored with cache_result are sent conditionally; a
+        response with status 304 means the cached result is still current.
+        
+        Bodies are streamed and abandoned past MAX_RESPONSE_BYTES, so a
+        misbehaving source can't balloon memory.
+        
         Args:
             url: URL to fetch
             method: HTTP method (GET, POST, etc.)
             data: Optional data for POST requests
-            retry_count: Current retry attempt
             
         Returns:
-            Response object or None if failed
+            (response, body) tuple or None if failed. The response is
+            already released; use it for status and headers only.
         """
-        self.rate_limit()
+        if method not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported method: {method}")
         
-        try:
-            self.logger.info(f"Fetching: {url}")
-            
-            if method == 'GET':
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            elif method == 'POST':
-                response = self.session.post(url, data=data, timeout=REQUEST_TIMEOUT)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-            
-            response.raise_for_status()
-            return response
-            
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            
-            # Don't retry client errors (4xx)
-            if 400 <= status_code < 500:
-                self.logger.error(f"Client error {status_code} for {url}: {e}")
-                return None
+        headers = {}
+        cached = self._http_cache.get(url) if method == 'GET' else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        for attempt in range(MAX_RETRIES + 1):
+            await self.rate_limit(url)
             
-            # Retry server errors (5xx)
-            if retry_count < MAX_RETRIES:
-                wait_time = 2 ** retry_count  # Exponential backoff
-                self.logger.warning(
-                    f"Server error {status_code}, retrying in {wait_time}s "
-                    f"(attempt {retry_count + 1}/{MAX_RETRIES})"
-                )
-                time.sleep(wait_time)
-                return self.fetch_page(url, method, data, retry_count + 1)
-            else:
-                self.logger.error(f"Max retries exceeded for {url}")
+            try:
+                self.logger.info(f"Fetching: {url}")
+                
+                async with self.session.request(
+                    method, url, data=data, headers=headers
+                ) as response:
+                    if response.status == 304:
+                        self.logger.info(f"Not modified since last run: {url}")
+                        return response, b''
+                    
+                    if response.status not in RETRY_STATUS_CODES:
+                        response.raise_for_status()
+                        body = await self._read_body(url, response)
+                        return (response, body) if body is not None else None
+                    
+                    status_code = response.status
+                    wait_time = self._retry_after(response)
+                
+            except aiohttp.ClientResponseError as e:
+                if 400 <= e.status < 500:
+                    self.logger.error(f"Client error {e.status} for {url}: {e}")
+                else:
+                    self.logger.error(f"Server error {e.status} for {url}: {e}")
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed for {url}: {e}")
-            return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"Request failed for {url}: {e}")
+                return None
+            
+            if attempt == MAX_RETRIES:
+                break
+            
+            if wait_time is None:
+                wait_time = 2 ** attempt  # Exponential backoff
+            self.logger.warning(
+                f"Server error {status_code}, retrying in {wait_time:.0f}s "
+                f"(attempt {attempt + 1}/{MAX_RETRIES})"
+            )
+            await asyncio.sleep(wait_time)
+        
+        self.logger.error(f"Max retries exceeded for {url}")
+        return None
     
-    def parse_html(self, html: str) -> Optional[BeautifulSoup]:
+    def parse_html(
+        self,
+        content: bytes,
+        encoding: Optional[str] = None
+    ) -> Optional[HTMLParser]:
         """
-        Parse HTML content with BeautifulSoup.
+        Parse raw HTML bytes with selectolax (Modest engine).
+        
+        Without a server-declared charset the undecoded body is handed to
+        the parser, which detects the encoding (including <meta charset>)
+        in C.
         
         Args:
-            html: HTML string to parse
+            content: HTML bytes to parse (response body)
+            encoding: Charset from the Content-Type header, if any
             
         Returns:
-            BeautifulSoup object or None if parsing fails
+            HTMLParser tree or None if parsing fails
         """
         try:
-            return BeautifulSoup(html, 'lxml')
+            if encoding:
+                try:
+                    content = content.decode(encoding, errors='replace')
+                except LookupError:
+                    self.logger.debug(f"Unknown charset '{encoding}', detecting instead")
+            
+            return HTMLParser(content)
         except Exception as e:
             self.logger.error(f"Error parsing HTML: {e}")
             return None
     
-    def extract_text(self, soup: BeautifulSoup, selector: str) -> str:
+    def extract_text(self, tree: Union[HTMLParser, Node], selector: str) -> str:
         """
         Safely extract text from HTML using CSS selector.
         
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed page or any node within it
             selector: CSS selector
             
         Returns:
             Extracted text or empty string
         """
         try:
-            element = soup.select_one(selector)
-            return element.get_text(strip=True) if element else ''
+            node = tree.css_first(selector)
+            return node.text().strip() if node is not None else ''
         except Exception as e:
             self.logger.error(f"Error extracting text with selector '{selector}': {e}")
             return ''
@@ -182,8 +433,6 @@ class EthicalScraper:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        # Remove special characters that might cause issues
-        text = text.replace('\xa0', ' ')
-        return text.strip()
+        # NFKC folds non-breaking and other exotic spaces into plain ones,
+        # then collapse all whitespace runs in a single pass
+        return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFKC', text)).strip()
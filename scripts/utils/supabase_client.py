@@ -3,13 +3,40 @@ Supabase client utilities for database operations.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from supabase import create_client, Client
-from config import SUPABASE_URL, SUPABASE_KEY
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional
+from config import SUPABASE_URL, SUPABASE_KEY, UPSERT_BATCH_SIZE, REQUEST_TIMEOUT
+
+if TYPE_CHECKING:
+    from supabase import Client
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _get_supabase() -> 'Client':
+    """
+    Create the process-wide Supabase client.
+    
+    Every SupabaseManager shares it, so the HTTP connection pool (and its
+    TLS sessions) is set up once per process rather than per manager.
+    
+    supabase is imported here rather than at module level: it pulls in
+    httpx, gotrue, postgrest, realtime and storage, which scripts only
+    need once they actually talk to the database (not for --help or
+    argument errors).
+    """
+    from supabase import create_client
+    from supabase.lib.client_options import ClientOptions
+    
+    return create_client(
+        SUPABASE_URL,
+        SUPABASE_KEY,
+        options=ClientOptions(
+            postgrest_client_timeout=REQUEST_TIMEOUT,
+            storage_client_timeout=REQUEST_TIMEOUT
+        )
+    )
+
 class SupabaseManager:
     """
     Manage Supabase database operations for resource management.
@@ -19,13 +46,16 @@ class SupabaseManager:
         if not SUPABASE_URL or not SUPABASE_KEY:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
         
-        self.client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        self.client: 'Client' = _get_supabase()
         self.logger = logger
     
     def upsert_resource(self, resource_data: Dict[str, Any]) -> bool:
         """
         Insert or update a resource in the database.
         
+        Resources are matched on their (unique) title, so this is a single
+        request regardless of whether the row already exists.
+        
         Args:
             resource_data: Resource dictionary with fields matching database schema
             
@@ -33,26 +63,10 @@ class SupabaseManager:
             True if successful, False otherwise
         """
         try:
-            # Check if resource exists by title
-            existing = self.client.table('resources')\
-                .select('id')\
-                .eq('title', resource_data['title'])\
+            self.client.table('resources')\
+                .upsert(resource_data, on_conflict='title')\
                 .execute()
-            
-            if existing.data:
-                # Update existing resource
-                resource_id = existing.data[0]['id']
-                self.client.table('resources')\
-                    .update(resource_data)\
-                    .eq('id', resource_id)\
-                    .execute()
-                self.logger.info(f"Updated resource: {resource_data['title']}")
-            else:
-                # Insert new resource
-                self.client.table('resources')\
-                    .insert(resource_data)\
-                    .execute()
-                self.logger.info(f"Inserted new resource: {resource_data['title']}")
+            self.logger.info(f"Upserted resource: {resource_data['title']}")
             
             return True
             
@@ -64,6 +78,13 @@ class SupabaseManager:
         """
         Bulk insert/update multiple resources.
         
+        Each batch of UPSERT_BATCH_SIZE rows is written by one call to the
+        upsert_resources() database function (see database/schema.sql),
+        which updates existing titles and inserts new ones in one
+        statement. As with upsert_resource, a field sent as None clears
+        the column; fields a resource leaves out keep their stored
+        values. A failed batch counts all of its rows as failed.
+        
         Args:
             resources: List of resource dictionaries
             
@@ -72,11 +93,16 @@ class SupabaseManager:
         """
         results = {'success': 0, 'failed': 0}
         
-        for resource in resources:
-            if self.upsert_resource(resource):
-                results['success'] += 1
-            else:
-                results['failed'] += 1
+        for start in range(0, len(resources), UPSERT_BATCH_SIZE):
+            batch = resources[start:start + UPSERT_BATCH_SIZE]
+            
+            try:
+                response = self.client.rpc('upsert_resources', {'payload': batch}).execute()
+                rows = response.data or []
+                results['success'] += rows[0]['affected'] if rows else 0
+            except Exception as e:
+                self.logger.error(f"Error upserting batch of {len(batch)} resources: {e}")
+                results['failed'] += len(batch)
         
         self.logger.info(
             f"Bulk upsert complete: {results['success']} succeeded, "
@@ -108,6 +134,44 @@ class SupabaseManager:
             self.logger.error(f"Error fetching resources: {e}")
             return []
     
+    def iter_resource_pages(
+        self, category: Optional[str] = None, page_size: int = 500
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetch resources one page at a time, optionally filtered by category.
+        
+        Pages are requested with .range() as they are consumed, so only one
+        page is held in memory. Rows are ordered by id to keep pages stable.
+        
+        Args:
+            category: Optional category filter (scholarship, visa, job, university)
+            page_size: Rows per request
+            
+        Yields:
+            Lists of up to page_size resource dictionaries
+        """
+        start = 0
+        
+        while True:
+            try:
+                query = self.client.table('resources').select('*')
+                
+                if category:
+                    query = query.eq('category', category)
+                
+                response = query.order('id').range(start, start + page_size - 1).execute()
+            except Exception as e:
+                self.logger.error(f"Error fetching resources from row {start}: {e}")
+                return
+            
+            page = response.data or []
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            
+            start += page_size
+    
     def delete_resource(self, resource_id: str) -> bool:
         """
         Delete a resource by ID.
@@ -11,28 +11,252 @@ Validates resources in database:
 Usage:
     python validate_data.py
     python validate_data.py --category scholarship
+    python validate_data.py --format text
     python validate_data.py --fix-broken-links
 """
 
 import argparse
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+import re
+import socket
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Iterator,
+    List,
+    Mapping,
+    Dict,
+    Any,
+    Optional,
+    Set,
+    Tuple,
+)
 from pathlib import Path
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, urlunsplit
+import aiohttp
+import orjson
+from yarl import URL
 
 from utils.supabase_client import SupabaseManager
-from config import STALE_DATA_THRESHOLD_DAYS, BROKEN_STATUS_CODES, REQUEST_TIMEOUT
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("logs/validate_data.log"), logging.StreamHandler()],
+from config import (
+    STALE_DATA_THRESHOLD_DAYS,
+    BROKEN_STATUS_CODES,
+    HEAD_UNSUPPORTED_STATUS_CODES,
+    REQUEST_TIMEOUT,
+    URL_CHECK_CONCURRENCY,
+    URL_CHECK_PER_HOST,
+    VALIDATION_BATCH_SIZE,
+    URL_CACHE_PATH,
+    URL_CACHE_TTL,
+    URL_CACHE_MAX_TTL,
+    PREV_RESULTS_PATH,
+    UNCHANGED_RESOURCE_TTL,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+REQUIRED_FIELDS = ["title", "category", "country"]
+SCHOLARSHIP_INSTITUTION = "institution (required for scholarships)"
+
+# validation_results lists that hold issues, in report order
+ISSUE_CHECKS = ["broken_links", "stale_data", "invalid_dates", "missing_fields"]
+
+# Columns validate_batch needs in its DataFrame
+_CHECKED_COLUMNS = ["id", *REQUIRED_FIELDS, "institution", "last_updated"]
+
+# Everything the checks look at; a change to any of these means a resource
+# has to be validated again
+_HASHED_FIELDS = [*_CHECKED_COLUMNS, "deadline", "url"]
+
+# Deadlines are stored as YYYY-MM-DD
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_MAX_AGE_RE = re.compile(r"(?:^|[,\s])max-age=\"?([0-9]+)")
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """
+    Parse a timestamp column value from the database.
+
+    Supabase/Postgres return ISO 8601, which datetime.fromisoformat parses
+    in C (on Python 3.11+ that includes "Z" and any fraction length, so
+    the string is passed through untouched); dateutil is only imported
+    for the odd value it rejects.
+
+    Args:
+        value: datetime or timestamp string
+
+    Returns:
+        Parsed datetime (timezone-aware if the value had an offset)
+    """
+    if isinstance(value, datetime):
+        return value
+
+    value = str(value)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser
+
+        return parser.parse(value)
+
+
+def cache_lifetime(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Work out how long a response may be reused from its caching headers.
+
+    Cache-Control takes precedence over Expires, as in RFC 9111.
+
+    Args:
+        headers: Response headers (case-insensitive)
+
+    Returns:
+        Lifetime in seconds (0 for no-store/no-cache), or None if the
+        response has no usable caching headers
+    """
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return float(match.group(1))
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+        except (TypeError, ValueError):
+            # Invalid dates (e.g. "0") mean already expired
+            return 0
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
+
+    return None
+
+
+def normalize_url(url: str) -> str:
+    """
+    Lower-case a URL's scheme and host, so trivial variants are checked once.
+
+    Args:
+        url: URL as stored on the resource
+
+    Returns:
+        Normalised URL (unchanged if it can't be parsed)
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit(
+        parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower())
+    )
+
+
+def resource_hash(resource: Dict[str, Any]) -> str:
+    """
+    Hash the fields the validation checks read.
+
+    Args:
+        resource: Resource dictionary
+
+    Returns:
+        Hex digest that changes whenever any checked field does
+    """
+    values = "\x1f".join(str(resource.get(field)) for field in _HASHED_FIELDS)
+    return hashlib.sha1(values.encode(), usedforsecurity=False).hexdigest()
+
+
+def _load_json_cache(path: str) -> Dict[str, Any]:
+    """
+    Load a cache file written by a previous run.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        Cached dictionary (empty if missing or unreadable)
+    """
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache {path}: {e}")
+        return {}
+
+
+def _save_json_cache(path: str, data: Dict[str, Any]) -> None:
+    """
+    Persist a cache file for the next run.
+
+    Args:
+        path: Cache file path
+        data: Dictionary to save
+    """
+    try:
+        cache_path = Path(path)
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(orjson.dumps(data))
+    except OSError as e:
+        logger.error(f"Error saving cache {path}: {e}")
+
+
+class _HostResolver(aiohttp.ThreadedResolver):
+    """
+    DNS resolver that looks each host up once per run.
+
+    Lookups can be started ahead of time with prefetch(), so they run in
+    parallel while URLs wait in the queue; requests to the same host share
+    the result (or the failure) instead of resolving again.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lookups: Dict[Tuple[str, int, int], asyncio.Future] = {}
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> List[Dict[str, Any]]:
+        key = (host, port, family)
+        if key not in self._lookups:
+            lookup = asyncio.ensure_future(super().resolve(host, port, family))
+            # Mark failures as retrieved, in case nothing ends up awaiting them
+            lookup.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._lookups[key] = lookup
+        # One cancelled request mustn't cancel the lookup for the others
+        return await asyncio.shield(self._lookups[key])
+
+    def prefetch(self, url: str) -> None:
+        """
+        Start resolving a URL's host, if it hasn't been already.
+
+        Args:
+            url: URL that is about to be checked
+        """
+        try:
+            parsed = URL(url)
+        except ValueError:
+            return
+        if parsed.raw_host:
+            # Same key TCPConnector uses: the IDNA-encoded raw_host, not the
+            # decoded host (and its default family is AF_UNSPEC)
+            asyncio.ensure_future(
+                self.resolve(parsed.raw_host, parsed.port or 0, socket.AF_UNSPEC)
+            ).add_done_callback(lambda f: f.cancelled() or f.exception())
+
 
 class DataValidator:
     """
@@ -41,6 +265,10 @@ class DataValidator:
 
     def __init__(self):
         self.db = SupabaseManager()
+        self.url_cache = _load_json_cache(URL_CACHE_PATH)
+        self.prev_results = _load_json_cache(PREV_RESULTS_PATH)
+        # Resource id -> hash, for the resources fully validated this run
+        self._checked_hashes: Dict[str, str] = {}
         self.validation_results = {
             "total_resources": 0,
             "broken_links": [],
@@ -50,11 +278,143 @@ class DataValidator:
             "passed": [],
         }
 
-    def check_url_status(self, url: str) -> Tuple[bool, int]:
+    def _save_url_cache(self) -> None:
+        """
+        Prune and persist URL check results for the next run.
+
+        Expired entries are only worth keeping for their Last-Modified
+        date (for a conditional re-check), and only for URL_CACHE_MAX_TTL
+        after they expire; everything else is dropped, so URLs no longer
+        used by any resource eventually leave the file.
+        """
+        now = time.time()
+        self.url_cache = {
+            url: entry
+            for url, entry in self.url_cache.items()
+            if now < entry.get("expires_at", 0)
+            or (
+                entry.get("last_modified")
+                and now - entry.get("expires_at", 0) < URL_CACHE_MAX_TTL
+            )
+        }
+        _save_json_cache(URL_CACHE_PATH, self.url_cache)
+
+    def _passed_ids(self) -> Set[str]:
+        """
+        Ids of the resources that passed every check, links included.
+
+        validation_results["passed"] is filled before the link checks run,
+        so resources whose URL turned out broken are removed here.
+
+        Returns:
+            Resource ids, as strings
+        """
+        broken = {str(item["id"]) for item in self.validation_results["broken_links"]}
+        return {str(id_) for id_ in self.validation_results["passed"]} - broken
+
+    def _save_prev_results(self) -> None:
+        """
+        Remember which resources passed every check in this run.
+
+        Resources that passed are stored with their hash and the current
+        time; ones that failed are dropped, so they are always checked
+        again. Entries older than UNCHANGED_RESOURCE_TTL are pruned.
+        """
+        passed = self._passed_ids()
+
+        now = time.time()
+        for key, digest in self._checked_hashes.items():
+            if key in passed:
+                self.prev_results[key] = {"hash": digest, "checked_at": now}
+            else:
+                self.prev_results.pop(key, None)
+
+        self.prev_results = {
+            key: entry
+            for key, entry in self.prev_results.items()
+            if now - entry["checked_at"] < UNCHANGED_RESOURCE_TTL
+        }
+        _save_json_cache(PREV_RESULTS_PATH, self.prev_results)
+
+    def _skip_unchanged(
+        self, batch: List[Dict[str, Any]], cutoff: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Split off the resources that passed recently and haven't changed.
+
+        Those are counted as passed without re-running the field, date and
+        link checks; only staleness, which depends on today's date, is
+        re-evaluated.
+
+        Args:
+            batch: List of resource dictionaries
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
+
+        Returns:
+            The resources that still need full validation
+        """
+        now = time.time()
+        changed, unchanged = [], []
+
+        for resource in batch:
+            key = str(resource["id"])
+            digest = resource_hash(resource)
+            prev = self.prev_results.get(key)
+
+            if (
+                prev
+                and prev["hash"] == digest
+                and now - prev["checked_at"] < UNCHANGED_RESOURCE_TTL
+            ):
+                unchanged.append(resource)
+            else:
+                self._checked_hashes[key] = digest
+                changed.append(resource)
+
+        if unchanged:
+            import pandas as pd
+
+            frame = pd.DataFrame(unchanged, columns=_CHECKED_COLUMNS)
+            for position in self.find_stale_data(frame, cutoff):
+                # Non-ISO last_updated; it parsed last time, so only
+                # staleness can come out of this
+                self.validate_dates(unchanged[position], cutoff)
+
+            self.validation_results["passed"].extend(r["id"] for r in unchanged)
+
+        return changed
+
+    @staticmethod
+    def _is_fresh(cached: Optional[Dict[str, Any]], now: float) -> bool:
+        """
+        Check whether a URL cache entry can be used without re-checking.
+
+        Args:
+            cached: Cache entry, or None
+            now: Current time.time()
+
+        Returns:
+            True if the entry exists and hasn't expired
+        """
+        return cached is not None and now < cached.get("expires_at", 0)
+
+    async def check_url_status(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Tuple[bool, int]:
         """
         Check if a URL is accessible.
 
+        Uses HEAD, falling back to a streamed one-byte GET for servers
+        that answer HEAD with 405/501.
+
+        Results are cached on disk for as long as the server's
+        Cache-Control/Expires headers allow (capped at URL_CACHE_MAX_TTL),
+        or URL_CACHE_TTL if it sends neither. Network errors are not
+        cached, so they are retried on the next run.
+
         Args:
+            session: Shared HTTP session
             url: URL to check
 
         Returns:
@@ -63,64 +423,198 @@ class DataValidator:
         if not url:
             return False, 0
 
+        now = time.time()
+        cached = self.url_cache.get(url)
+        if self._is_fresh(cached, now):
+            return cached["is_valid"], cached["status_code"]
+
+        # Let the server answer 304 (no body) if a valid page hasn't changed
+        headers = {}
+        if cached and cached["is_valid"] and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = requests.head(
-                url,
-                timeout=REQUEST_TIMEOUT,
-                allow_redirects=True,
-                headers={"User-Agent": "NepaliAbroadHelper/DataValidator"},
-            )
+            async with session.head(
+                url, allow_redirects=True, headers=headers
+            ) as response:
+                pass
+
+            if response.status in HEAD_UNSUPPORTED_STATUS_CODES:
+                # Some servers reject HEAD; ask for the first byte and
+                # release the response without reading it, so only headers
+                # come back
+                async with session.get(
+                    url,
+                    allow_redirects=True,
+                    headers={**headers, "Range": "bytes=0-0"},
+                ) as response:
+                    pass
 
-            is_valid = response.status_code not in BROKEN_STATUS_CODES
-            return is_valid, response.status_code
+            last_modified = response.headers.get("Last-Modified")
+            if response.status == 304:
+                is_valid, status_code = True, cached["status_code"]
+                last_modified = last_modified or cached["last_modified"]
+            else:
+                is_valid = response.status not in BROKEN_STATUS_CODES
+                status_code = response.status
 
-        except requests.exceptions.RequestException as e:
+            lifetime = cache_lifetime(response.headers)
+            if lifetime is None:
+                lifetime = URL_CACHE_TTL
+
+            self.url_cache[url] = {
+                "expires_at": now + min(lifetime, URL_CACHE_MAX_TTL),
+                "is_valid": is_valid,
+                "status_code": status_code,
+                "last_modified": last_modified,
+            }
+            return is_valid, status_code
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.warning(f"Error checking URL {url}: {e}")
             return False, 0
 
-    def check_links_parallel(self, resources: List[Dict[str, Any]]) -> None:
+    def _record_link(
+        self, resource: Dict[str, Any], result: Optional[Tuple[bool, int]]
+    ) -> None:
         """
-        Check all resource URLs in parallel for efficiency.
+        Record a resource's link as broken if its check failed.
 
         Args:
-            resources: List of resource dictionaries
+            resource: Resource dictionary with a URL
+            result: (is_valid, status_code), or None if the check itself errored
         """
-        logger.info(f"Checking {len(resources)} URLs in parallel...")
+        if result is None or result[0]:
+            return
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_resource = {
-                executor.submit(self.check_url_status, r["url"]): r
-                for r in resources
-                if r.get("url")
+        status_code = result[1]
+        self.validation_results["broken_links"].append(
+            {
+                "id": resource["id"],
+                "title": resource["title"],
+                "url": resource["url"],
+                "status_code": status_code,
+                "category": resource["category"],
             }
+        )
+        logger.warning(
+            f"Broken link [{status_code}]: {resource['title']} - {resource['url']}"
+        )
 
-            for future in as_completed(future_to_resource):
-                resource = future_to_resource[future]
-                try:
-                    is_valid, status_code = future.result()
-
-                    if not is_valid:
-                        self.validation_results["broken_links"].append(
-                            {
-                                "id": resource["id"],
-                                "title": resource["title"],
-                                "url": resource["url"],
-                                "status_code": status_code,
-                                "category": resource["category"],
-                            }
-                        )
-                        logger.warning(
-                            f"Broken link [{status_code}]: {resource['title']} - {resource['url']}"
-                        )
-                except Exception as e:
-                    logger.error(f"Error checking {resource['title']}: {e}")
-
-    def validate_dates(self, resource: Dict[str, Any]) -> List[str]:
+    async def _link_worker(
+        self,
+        session: aiohttp.ClientSession,
+        queue: asyncio.Queue,
+        waiting: Dict[str, List[Dict[str, Any]]],
+        results: Dict[str, Optional[Tuple[bool, int]]],
+    ) -> None:
+        """
+        Check URLs from the queue until the None sentinel arrives.
+
+        Args:
+            session: Shared HTTP session
+            queue: Queue of normalised URLs
+            waiting: Normalised URL -> resources waiting for its result
+            results: Normalised URL -> result, filled in as checks finish
+        """
+        while True:
+            url = await queue.get()
+            if url is None:
+                return
+
+            try:
+                result = await self.check_url_status(session, url)
+            except Exception as e:
+                logger.error(f"Error checking {url}: {e}")
+                result = None
+
+            results[url] = result
+            for resource in waiting.pop(url):
+                self._record_link(resource, result)
+
+    async def _check_all(self, resources: AsyncIterator[Dict[str, Any]]) -> None:
+        """
+        Check all resource URLs concurrently on one event loop.
+
+        URL_CHECK_CONCURRENCY workers consume a bounded queue, so only
+        a small window of URLs is pending at any time instead of one
+        task per resource. Each distinct URL (see normalize_url) is
+        checked once and its result applies to every resource using it.
+        Hosts are resolved as soon as their first URL is queued, so DNS
+        lookups overlap waiting for a worker; a host that doesn't resolve
+        fails all of its URLs at once.
+
+        Up to URL_CHECK_CONCURRENCY HEAD requests are in flight at once,
+        and at most URL_CHECK_PER_HOST to any one server.
+
+        Args:
+            resources: Async iterator of resource dictionaries
+        """
+        waiting: Dict[str, List[Dict[str, Any]]] = {}
+        results: Dict[str, Optional[Tuple[bool, int]]] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * URL_CHECK_CONCURRENCY)
+        # At most URL_CHECK_PER_HOST connections to any one server. Only
+        # socket timeouts are set: time spent waiting for a free
+        # per-host slot shouldn't count against a request
+        resolver = _HostResolver()
+        connector = aiohttp.TCPConnector(
+            limit=URL_CHECK_CONCURRENCY,
+            limit_per_host=URL_CHECK_PER_HOST,
+            resolver=resolver,
+            use_dns_cache=False,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT
+        )
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"User-Agent": "NepaliAbroadHelper/DataValidator"},
+        ) as session:
+            workers = [
+                asyncio.create_task(
+                    self._link_worker(session, queue, waiting, results)
+                )
+                for _ in range(URL_CHECK_CONCURRENCY)
+            ]
+
+            async for resource in resources:
+                if not resource.get("url"):
+                    continue
+
+                url = normalize_url(resource["url"])
+                if url in results:
+                    self._record_link(resource, results[url])
+                elif url in waiting:
+                    waiting[url].append(resource)
+                else:
+                    waiting[url] = [resource]
+                    if not self._is_fresh(self.url_cache.get(url), time.time()):
+                        resolver.prefetch(url)
+                    await queue.put(url)
+            for _ in workers:
+                await queue.put(None)
+
+            await asyncio.gather(*workers)
+
+        logger.info(f"Checked {len(results)} distinct URLs")
+
+    def validate_dates(
+        self,
+        resource: Dict[str, Any],
+        cutoff: datetime,
+        check_last_updated: bool = True,
+    ) -> List[str]:
         """
         Validate date fields in resource.
     
         Args:
             resource: Resource dictionary
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
+            check_last_updated: Also check last_updated (False when
+                find_stale_data has already handled it)
         
         Returns:
             List of validation errors (empty if all valid)
@@ -128,29 +622,31 @@ class DataValidator:
         errors = []
     
         # Check deadline format
-        if resource.get('deadline'):
-            try:
-                # Deadline is just a date, not datetime
-                if isinstance(resource['deadline'], str):
-                    datetime.strptime(resource['deadline'], '%Y-%m-%d')
-            except (ValueError, TypeError):
-                errors.append(f"Invalid deadline format: {resource['deadline']}")
+        deadline = resource.get('deadline')
+        if deadline and isinstance(deadline, str):
+            # Deadline is just a date, not datetime. Check the shape first so
+            # malformed values are rejected without raising; fromisoformat
+            # then only has to catch impossible dates like 2025-02-30
+            is_valid = _DATE_RE.fullmatch(deadline) is not None
+            if is_valid:
+                try:
+                    date.fromisoformat(deadline)
+                except ValueError:
+                    is_valid = False
+            if not is_valid:
+                errors.append(f"Invalid deadline format: {deadline}")
     
         # Check last_updated (more robust handling)
-        if resource.get('last_updated'):
+        if check_last_updated and resource.get('last_updated'):
             try:
-                from dateutil import parser
-            
-                # Use dateutil.parser which handles all ISO 8601 formats
-                last_updated = parser.parse(str(resource['last_updated']))
+                last_updated = parse_timestamp(resource['last_updated'])
             
-                # Make timezone-naive for comparison
-                if last_updated.tzinfo is not None:
-                    last_updated = last_updated.replace(tzinfo=None)
+                # Timestamps without an offset are UTC, as in find_stale_data
+                if last_updated.tzinfo is None:
+                    last_updated = last_updated.replace(tzinfo=timezone.utc)
             
-                days_old = (datetime.now() - last_updated).days
-            
-                if days_old > STALE_DATA_THRESHOLD_DAYS:
+                if last_updated <= cutoff:
+                    days_old = (datetime.now(timezone.utc) - last_updated).days
                     self.validation_results['stale_data'].append({
                         'id': resource['id'],
                         'title': resource['title'],
@@ -163,47 +659,111 @@ class DataValidator:
     
         return errors
 
-    def validate_required_fields(self, resource: Dict[str, Any]) -> List[str]:
+    def find_stale_data(
+        self, resources: "pd.DataFrame", cutoff: datetime
+    ) -> Set[int]:
         """
-        Check for missing required fields.
+        Flag stale resources by parsing the whole last_updated column at once.
+
+        pandas parses ISO 8601 column-wise in C; days_old and stale_data
+        records are only computed for the rows at or before the cutoff.
 
         Args:
-            resource: Resource dictionary
+            resources: DataFrame with one row per resource
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
 
         Returns:
-            List of missing field names
+            Row positions whose last_updated is not ISO 8601, to be checked
+            one at a time by validate_dates
         """
-        required_fields = ["title", "category", "country"]
-        missing = []
+        import pandas as pd
 
-        for field in required_fields:
-            if not resource.get(field):
-                missing.append(field)
+        if "last_updated" not in resources:
+            return set()
 
-        # Category-specific required fields
-        if resource.get("category") == "scholarship":
-            if not resource.get("institution"):
-                missing.append("institution (required for scholarships)")
+        raw = resources["last_updated"]
+        timestamps = pd.to_datetime(raw, utc=True, errors="coerce", format="ISO8601")
+        stale = timestamps <= pd.Timestamp(cutoff)
+        days_old = (pd.Timestamp.now(tz="UTC") - timestamps[stale]).dt.days
+        # Zip plain lists rather than DataFrame.to_dict, which boxes every
+        # cell through pandas
+        self.validation_results["stale_data"].extend(
+            {"id": id_, "title": title, "days_old": days, "last_updated": value}
+            for id_, title, days, value in zip(
+                resources["id"][stale].tolist(),
+                resources["title"][stale].tolist(),
+                days_old.tolist(),
+                raw[stale].tolist(),
+            )
+        )
 
-        return missing
+        unparsed = timestamps.isna() & raw.notna() & raw.ne("")
+        return set(unparsed.index[unparsed])
 
-    def validate_all_resources(self, category: str = None) -> None:
+    def validate_required_fields(
+        self, resources: "pd.DataFrame"
+    ) -> Dict[int, List[str]]:
         """
-        Run all validation checks on resources.
+        Check every resource for missing required fields at once.
+
+        Each field is checked as a plain NumPy object array, which skips
+        the per-operation overhead of DataFrame arithmetic; lists of names
+        are only built for the rows that are actually missing something.
 
         Args:
-            category: Optional category filter
+            resources: DataFrame with one row per resource
+
+        Returns:
+            Dictionary of row position -> missing field names (rows with
+            nothing missing are omitted)
         """
-        logger.info("Fetching resources from database...")
-        resources = self.db.get_all_resources(category)
+        import numpy as np
+        import pandas as pd
 
-        self.validation_results["total_resources"] = len(resources)
-        logger.info(f"Validating {len(resources)} resources...")
+        columns = resources.reindex(columns=REQUIRED_FIELDS + ["institution"])
+
+        def is_blank(field: str) -> "np.ndarray":
+            values = columns[field].to_numpy(dtype=object)
+            return pd.isna(values) | (values == "")
+
+        is_scholarship = columns["category"].to_numpy(dtype=object) == "scholarship"
+        missing = np.column_stack(
+            [is_blank(field) for field in REQUIRED_FIELDS]
+            # Category-specific required fields
+            + [is_scholarship & is_blank("institution")]
+        )
+
+        names = REQUIRED_FIELDS + [SCHOLARSHIP_INSTITUTION]
+        return {
+            int(position): [names[i] for i in np.flatnonzero(missing[position])]
+            for position in np.flatnonzero(missing.any(axis=1))
+        }
+
+    def validate_batch(
+        self, resources: List[Dict[str, Any]], cutoff: datetime
+    ) -> None:
+        """
+        Run the field and date checks on a batch of resources.
+
+        Args:
+            resources: List of resource dictionaries
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
+        """
+        # pandas takes a while to import, so only load it once there is
+        # something to validate
+        import pandas as pd
+
+        # Only the columns the checks read, not descriptions and other text
+        frame = pd.DataFrame(resources, columns=_CHECKED_COLUMNS)
+        missing_by_row = self.validate_required_fields(frame)
+        unparsed_dates = self.find_stale_data(frame, cutoff)
 
         # Check required fields and dates
-        for resource in resources:
+        for position, resource in enumerate(resources):
             # Check required fields
-            missing_fields = self.validate_required_fields(resource)
+            missing_fields = missing_by_row.get(position, [])
             if missing_fields:
                 self.validation_results["missing_fields"].append(
                     {
@@ -214,7 +774,9 @@ class DataValidator:
                 )
 
             # Validate dates
-            date_errors = self.validate_dates(resource)
+            date_errors = self.validate_dates(
+                resource, cutoff, check_last_updated=position in unparsed_dates
+            )
             if date_errors:
                 self.validation_results["invalid_dates"].append(
                     {
@@ -228,23 +790,99 @@ class DataValidator:
             if not missing_fields and not date_errors:
                 self.validation_results["passed"].append(resource["id"])
 
-        # Check URLs (parallel)
-        self.check_links_parallel(resources)
-
-    def generate_report(self) -> str:
+    def _prepare_batch(
+        self, batch: List[Dict[str, Any]], cutoff: datetime
+    ) -> List[Dict[str, Any]]:
         """
-        Generate human-readable validation report.
+        Validate a batch, skipping resources unchanged since a passing run.
+
+        Args:
+            batch: List of resource dictionaries
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
 
         Returns:
-            Report string
+            The resources that still need their links checked
+        """
+        self.validation_results["total_resources"] += len(batch)
+        batch = self._skip_unchanged(batch, cutoff)
+        if batch:
+            self.validate_batch(batch, cutoff)
+        return batch
+
+    async def _validated(
+        self, batches: Iterator[List[Dict[str, Any]]], cutoff: datetime
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        report = []
-        report.append("\n" + "=" * 60)
-        report.append("DATA VALIDATION REPORT")
-        report.append("=" * 60)
-        report.append(f"Timestamp: {datetime.now().isoformat()}")
-        report.append(f"Total Resources: {self.validation_results['total_resources']}")
-        report.append("")
+        Validate each batch, then pass its resources on for link checking.
+
+        Fetching a batch (a blocking Supabase request) and validating it
+        both run in a worker thread, so the event loop keeps sending and
+        receiving link checks for earlier batches meanwhile.
+
+        Args:
+            batches: Iterator of resource lists
+            cutoff: Timezone-aware time at or before which last_updated
+                counts as stale
+
+        Yields:
+            Resource dictionaries, once their batch has been validated
+        """
+        while True:
+            batch = await asyncio.to_thread(next, batches, None)
+            if batch is None:
+                return
+
+            for resource in await asyncio.to_thread(
+                self._prepare_batch, batch, cutoff
+            ):
+                yield resource
+
+    def validate_all_resources(self, category: str = None) -> None:
+        """
+        Run all validation checks on resources.
+
+        Resources are streamed from the database a page at a time. Field
+        and date checks run one page at a time, and each page's URLs are
+        queued for checking as soon as it is done, so the link checks of
+        earlier pages overlap fetching and validating later ones.
+
+        Resources that passed every check within UNCHANGED_RESOURCE_TTL
+        and hash the same as then are not re-checked (see
+        _skip_unchanged).
+
+        Args:
+            category: Optional category filter
+        """
+        logger.info("Validating resources and checking URLs...")
+
+        pages = self.db.iter_resource_pages(category, page_size=VALIDATION_BATCH_SIZE)
+        # Stale means more than STALE_DATA_THRESHOLD_DAYS whole days old
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            days=STALE_DATA_THRESHOLD_DAYS + 1
+        )
+
+        asyncio.run(self._check_all(self._validated(pages, cutoff)))
+        self._save_url_cache()
+        self._save_prev_results()
+
+        logger.info(
+            f"Validated {self.validation_results['total_resources']} resources"
+        )
+
+    def _iter_report(self) -> Iterator[str]:
+        """
+        Generate the human-readable validation report line by line.
+
+        Yields:
+            Report lines, without trailing newlines
+        """
+        yield "\n" + "=" * 60
+        yield "DATA VALIDATION REPORT"
+        yield "=" * 60
+        yield f"Timestamp: {datetime.now().isoformat()}"
+        yield f"Total Resources: {self.validation_results['total_resources']}"
+        yield ""
 
         # Summary
         issues_count = (
@@ -255,79 +893,121 @@ class DataValidator:
         )
 
         if issues_count == 0:
-            report.append("✅ All validations passed!")
+            yield "✅ All validations passed!"
         else:
-            report.append(f"⚠️  Found {issues_count} issues")
+            yield f"⚠️  Found {issues_count} issues"
 
-        report.append("")
+        yield ""
 
         # Broken Links
         if self.validation_results["broken_links"]:
-            report.append(
-                f"🔗 BROKEN LINKS ({len(self.validation_results['broken_links'])})"
-            )
-            report.append("-" * 60)
+            yield f"🔗 BROKEN LINKS ({len(self.validation_results['broken_links'])})"
+            yield "-" * 60
             for item in self.validation_results["broken_links"]:
-                report.append(
+                yield (
                     f"  [{item['status_code']}] {item['title']}\n"
                     f"    URL: {item['url']}\n"
                     f"    Category: {item['category']}"
                 )
-            report.append("")
+            yield ""
 
         # Stale Data
         if self.validation_results["stale_data"]:
-            report.append(
-                f"📅 STALE DATA ({len(self.validation_results['stale_data'])})"
-            )
-            report.append("-" * 60)
+            yield f"📅 STALE DATA ({len(self.validation_results['stale_data'])})"
+            yield "-" * 60
             for item in self.validation_results["stale_data"]:
-                report.append(
+                yield (
                     f"  {item['title']}\n"
                     f"    Last updated: {item['last_updated']}\n"
                     f"    Days old: {item['days_old']}"
                 )
-            report.append("")
+            yield ""
 
         # Invalid Dates
         if self.validation_results["invalid_dates"]:
-            report.append(
-                f"📆 INVALID DATES ({len(self.validation_results['invalid_dates'])})"
-            )
-            report.append("-" * 60)
+            yield f"📆 INVALID DATES ({len(self.validation_results['invalid_dates'])})"
+            yield "-" * 60
             for item in self.validation_results["invalid_dates"]:
-                report.append(f"  {item['title']}")
+                yield f"  {item['title']}"
                 for error in item["errors"]:
-                    report.append(f"    - {error}")
-            report.append("")
+                    yield f"    - {error}"
+            yield ""
 
         # Missing Fields
         if self.validation_results["missing_fields"]:
-            report.append(
-                f"📝 MISSING FIELDS ({len(self.validation_results['missing_fields'])})"
-            )
-            report.append("-" * 60)
+            yield f"📝 MISSING FIELDS ({len(self.validation_results['missing_fields'])})"
+            yield "-" * 60
             for item in self.validation_results["missing_fields"]:
-                report.append(f"  {item['title']}")
-                report.append(f"    Missing: {', '.join(item['missing'])}")
-            report.append("")
+                yield f"  {item['title']}"
+                yield f"    Missing: {', '.join(item['missing'])}"
+            yield ""
 
-        report.append("=" * 60)
+        yield "=" * 60
 
-        return "\n".join(report)
+    def generate_report(self) -> str:
+        """
+        Generate human-readable validation report.
+
+        Returns:
+            Report string
+        """
+        return "\n".join(self._iter_report())
 
-    def save_report(self, filename: str = "validation_report.txt") -> None:
+    def print_report(self) -> None:
+        """
+        Print the human-readable validation report to stdout as it is
+        generated.
+        """
+        sys.stdout.writelines(f"{line}\n" for line in self._iter_report())
+
+    def save_report(
+        self, filename: str = "validation_report.txt", echo: bool = False
+    ) -> None:
         """
         Save validation report to file.
 
+        Lines are written as they are generated, so the full report is
+        never held in memory.
+
         Args:
             filename: Output filename
+            echo: Also print each line to stdout
         """
-        report = self.generate_report()
-
         output_path = Path("logs") / filename
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report)
+            for line in self._iter_report():
+                f.write(line)
+                f.write("\n")
+                if echo:
+                    sys.stdout.write(line)
+                    sys.stdout.write("\n")
+
+        logger.info(f"Report saved to {output_path}")
+
+    def save_json_report(self, filename: str = "validation_report.jsonl") -> None:
+        """
+        Save validation results as JSON lines for other tools to read.
+
+        The first line is a summary; every following line is one issue,
+        tagged with the check that found it (see ISSUE_CHECKS).
+
+        Args:
+            filename: Output filename
+        """
+        summary = {
+            "timestamp": datetime.now().isoformat(),
+            "total_resources": self.validation_results["total_resources"],
+            "passed": len(self._passed_ids()),
+        }
+
+        output_path = Path("logs") / filename
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(summary))
+            f.write(b"\n")
+            for check in ISSUE_CHECKS:
+                for item in self.validation_results[check]:
+                    f.write(orjson.dumps({"check": check, **item}))
+                    f.write(b"\n")
 
         logger.info(f"Report saved to {output_path}")
 
@@ -341,7 +1021,14 @@ def main():
         help="Validate specific category only",
     )
     parser.add_argument(
-        "--output", default="validation_report.txt", help="Output report filename"
+        "--format",
+        choices=["jsonl", "text"],
+        default="jsonl",
+        help="Report format: JSON lines for tooling, or human-readable text",
+    )
+    parser.add_argument(
+        "--output",
+        help="Output report filename (default: validation_report.jsonl/.txt)",
     )
 
     args = parser.parse_args()
@@ -349,6 +1036,18 @@ def main():
     # Create logs directory
     Path("logs").mkdir(exist_ok=True)
 
+    # Configure logging here, not at import, and don't open a second log
+    # file if the caller already set up handlers
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+            handlers=[
+                logging.FileHandler("logs/validate_data.log"),
+                logging.StreamHandler(),
+            ],
+        )
+
     validator = DataValidator()
 
     print("=" * 60)
@@ -358,14 +1057,18 @@ def main():
     # Run validation
     validator.validate_all_resources(args.category)
 
-    # Generate and display report
-    report = validator.generate_report()
-    print(report)
-
-    # Save report
-    validator.save_report(args.output)
+    # Save and display report
+    if args.format == "text":
+        output = args.output or "validation_report.txt"
+        validator.save_report(output, echo=True)
+    else:
+        output = args.output or "validation_report.jsonl"
+        validator.save_json_report(output)
+        # Only render the text report when someone is watching
+        if sys.stdout.isatty():
+            validator.print_report()
 
-    print(f"\n✅ Validation complete! Report saved to logs/{args.output}")
+    print(f"\n✅ Validation complete! Report saved to logs/{output}")
 
 
 if __name__ == "__main__":